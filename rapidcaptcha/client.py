@@ -20,9 +20,12 @@ __author__ = "Galkurta"
 __email__ = "support@rapidcaptcha.xyz"
 
 import asyncio
+import sys
+import threading
 import time
 import json
-from typing import Dict, Optional, Union, List
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, Union, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -32,12 +35,77 @@ try:
 except ImportError:
     HAS_AIOHTTP = False
 
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import h2  # noqa: F401 (used by httpx for HTTP/2)
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
 try:
     import requests
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_loads: Callable[[Union[str, bytes, bytearray]], Any]
+_dumps: Callable[[Any], str]
+
+if HAS_ORJSON:
+    _loads = orjson.loads
+
+    def _orjson_dumps(obj: Any) -> str:
+        return str(orjson.dumps(obj), "utf-8")
+
+    _dumps = _orjson_dumps
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
+
+# Async response bodies smaller than this are streamed into one buffer
+_STREAM_BODY_LIMIT = 65536
+
+
+async def _read_body_async(response: "aiohttp.ClientResponse") -> Union[bytes, bytearray]:
+    """Read an aiohttp response body for parsing"""
+    length = response.content_length
+    if length is None or length >= _STREAM_BODY_LIMIT:
+        return await response.read()
+    
+    # API payloads are small: collect the chunks in one bytearray, which
+    # json.loads and orjson.loads both parse without converting to bytes
+    buffer = bytearray()
+    async for chunk in response.content.iter_any():
+        buffer.extend(chunk)
+    return buffer
+
+
+async def _read_error_async(response: "aiohttp.ClientResponse") -> Any:
+    """Parse an aiohttp error response body, or return None if it isn't JSON"""
+    try:
+        return _loads(await response.read())
+    except ValueError:
+        return None
+
+
+def _expected_status(status: int, expected: Union[int, Tuple[int, ...]]) -> int:
+    """Pick the status a response is checked against from the accepted ones"""
+    if isinstance(expected, int):
+        return expected
+    return status if status in expected else expected[-1]
+
 
 class CaptchaType(Enum):
     TURNSTILE = "turnstile"
@@ -50,7 +118,13 @@ class TaskStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+_STATUS_MAP = {status.value: status for status in TaskStatus}
+
+# Slotted dataclasses are only available on Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class CaptchaResult:
     """Result object for CAPTCHA solving"""
     task_id: str
@@ -67,17 +141,17 @@ class CaptchaResult:
     @property
     def is_success(self) -> bool:
         """Check if the solve was successful"""
-        return self.status == TaskStatus.SUCCESS
+        return self.status is TaskStatus.SUCCESS
 
     @property
     def is_error(self) -> bool:
         """Check if the solve failed"""
-        return self.status == TaskStatus.ERROR
+        return self.status is TaskStatus.ERROR
 
     @property
     def is_pending(self) -> bool:
         """Check if the solve is still pending"""
-        return self.status == TaskStatus.PENDING
+        return self.status is TaskStatus.PENDING
 
     def __str__(self) -> str:
         if self.is_success:
@@ -89,6 +163,14 @@ class CaptchaResult:
             return f"CaptchaResult(PENDING, task_id={self.task_id})"
 
 
+class _Endpoints:
+    """API endpoint paths, relative to the client's base URL"""
+    HEALTH = "/"
+    SOLVE_TURNSTILE = "/api/solve/turnstile"
+    SOLVE_RECAPTCHA = "/api/solve/recaptcha"
+    RESULT = "/api/result/"
+
+
 class RapidCaptchaError(Exception):
     """Base exception for RapidCaptcha errors"""
     pass
@@ -138,7 +220,9 @@ class RapidCaptchaClient:
         base_url: str = "https://rapidcaptcha.xyz",
         timeout: int = 300,
         max_retries: int = 3,
-        retry_delay: float = 2.0
+        retry_delay: float = 2.0,
+        max_concurrent: int = 10,
+        transport: str = "aiohttp"
     ):
         """
         Initialize RapidCaptcha client
@@ -149,9 +233,13 @@ class RapidCaptchaClient:
             timeout: Maximum time to wait for task completion in seconds
             max_retries: Maximum number of retries for failed requests
             retry_delay: Delay between retries in seconds
+            max_concurrent: Maximum number of simultaneous connections used by async methods
+            transport: HTTP library used by async methods: "aiohttp" (HTTP/1.1)
+                or "httpx" (HTTP/2, multiplexing requests over one connection)
             
         Raises:
             APIKeyError: If API key format is invalid
+            ValidationError: If max_concurrent is less than 1 or transport is unknown
         """
         if (
             not isinstance(api_key, str)
@@ -162,16 +250,146 @@ class RapidCaptchaClient:
             raise APIKeyError("Invalid API key format. Must start with 'Rapidcaptcha-' and have a non-empty suffix")
         
         self.api_key = api_key
-        self.base_url = base_url.rstrip('/')
+        self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         
+        if max_concurrent < 1:
+            raise ValidationError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        
+        if transport not in ("aiohttp", "httpx"):
+            raise ValidationError(f"Unsupported transport: {transport}")
+        self.transport = transport
+        
         self.headers = {
             "X-API-Key": self.api_key,
             "Content-Type": "application/json",
             "User-Agent": f"RapidCaptcha-Python-SDK/{__version__}"
         }
+        
+        # Shared aiohttp sessions (or httpx clients) for async operations,
+        # one per event loop and created on first use there. Pooled
+        # connections belong to the loop that opened them, and one client
+        # may be used from several loops or threads at once
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._long_poll_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._httpx_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sessions_lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        """API base URL, without a trailing slash"""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        # Endpoint URLs are built when the base URL is set rather than
+        # formatted on every request
+        self._base_url = value.rstrip('/')
+        self._health_url = self._base_url + _Endpoints.HEALTH
+        self._turnstile_url = self._base_url + _Endpoints.SOLVE_TURNSTILE
+        self._recaptcha_url = self._base_url + _Endpoints.SOLVE_RECAPTCHA
+        self._result_prefix = self._base_url + _Endpoints.RESULT
+
+    def _result_url(self, task_id: str) -> str:
+        """Return the result endpoint URL for a task"""
+        return self._result_prefix + task_id
+
+    async def __aenter__(self) -> "RapidCaptchaClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the aiohttp sessions or httpx client used on the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            sessions = [self._sessions.pop(loop, None), self._long_poll_sessions.pop(loop, None)]
+            httpx_client = self._httpx_clients.pop(loop, None)
+            self._forget_closed_loops()
+        
+        for session in sessions:
+            if session is not None and not session.closed:
+                await session.close()
+        if httpx_client is not None and not httpx_client.is_closed:
+            await httpx_client.aclose()
+
+    def _forget_closed_loops(self) -> None:
+        """Drop the sessions of event loops that have been closed"""
+        # Their connections died with the loop and can't be closed from
+        # another one; detaching marks a session closed so it isn't
+        # reported as leaked. Sessions of loops that are still open are
+        # left alone, since that loop may be running requests on them
+        for sessions in (self._sessions, self._long_poll_sessions):
+            for loop in [loop for loop in sessions if loop.is_closed()]:
+                sessions.pop(loop).detach()
+        for loop in [loop for loop in self._httpx_clients if loop.is_closed()]:
+            del self._httpx_clients[loop]
+
+    def _get_session(self, long_poll: bool = False) -> "aiohttp.ClientSession":
+        """
+        Return the running event loop's shared aiohttp session, creating it on first use
+        
+        Long-polling submits get a session and connection pool of their own:
+        time spent waiting for a free pooled connection counts against a
+        request's timeout, so ordinary requests must not queue behind
+        requests the server holds open.
+        """
+        sessions = self._long_poll_sessions if long_poll else self._sessions
+        loop = asyncio.get_running_loop()
+        session = sessions.get(loop)
+        if session is None or session.closed:
+            # The connector caps in-flight sockets, which is what the API's
+            # rate limits actually see
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent,
+                limit_per_host=self.max_concurrent,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                json_serialize=_dumps
+            )
+            with self._sessions_lock:
+                self._forget_closed_loops()
+                sessions[loop] = session
+        return session
+
+    def _get_httpx_client(self) -> "httpx.AsyncClient":
+        """Return the running event loop's shared HTTP/2 httpx client, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        httpx_client = self._httpx_clients.get(loop)
+        if httpx_client is None or httpx_client.is_closed:
+            limits = httpx.Limits(
+                max_connections=self.max_concurrent,
+                max_keepalive_connections=self.max_concurrent,
+                keepalive_expiry=60
+            )
+            httpx_client = httpx.AsyncClient(http2=True, limits=limits)
+            with self._sessions_lock:
+                self._forget_closed_loops()
+                self._httpx_clients[loop] = httpx_client
+        return httpx_client
+
+    def _check_async_transport(self) -> None:
+        """Raise ImportError if the library for the configured transport is missing"""
+        if self.transport == "httpx":
+            if not HAS_HTTPX:
+                raise ImportError("httpx library is required for the httpx transport. Install with: pip install httpx[http2]")
+            if not HAS_H2:
+                raise ImportError("h2 library is required for the httpx transport's HTTP/2 support. Install with: pip install httpx[http2]")
+        elif not HAS_AIOHTTP:
+            raise ImportError("aiohttp library is required for async operations. Install with: pip install aiohttp")
 
     def _validate_url(self, url: str) -> None:
         """Validate URL parameter"""
@@ -180,6 +398,28 @@ class RapidCaptchaClient:
         if not url.startswith(("http://", "https://")):
             raise ValidationError("URL must start with http:// or https://")
 
+    def _parse_result(self, data: Dict, task_id: str) -> CaptchaResult:
+        """Build a CaptchaResult from a result endpoint payload"""
+        result_data = data.get("result", {})
+        status_value = data.get("status", "pending")
+        status = _STATUS_MAP.get(status_value)
+        if status is None:
+            # Unknown statuses raise ValueError, as TaskStatus(value) does
+            status = TaskStatus(status_value)
+        
+        return CaptchaResult(
+            task_id=data.get("task_id", task_id),
+            status=status,
+            token=result_data.get("token"),
+            turnstile_value=result_data.get("turnstile_value"),
+            elapsed_time_seconds=result_data.get("elapsed_time_seconds"),
+            sitekey_used=result_data.get("sitekey_used"),
+            sitekeys_tried=result_data.get("sitekeys_tried"),
+            reason=result_data.get("reason"),
+            errors=result_data.get("errors"),
+            completed_at=data.get("completed_at")
+        )
+
     def _handle_response(self, response, expected_status: int = 200) -> Dict:
         """Handle HTTP response and raise appropriate exceptions"""
         if response.status_code == 401:
@@ -219,7 +459,7 @@ class RapidCaptchaClient:
         if not HAS_REQUESTS:
             raise ImportError("requests library is required for sync operations. Install with: pip install requests")
         
-        response = requests.get(f"{self.base_url}/", headers=self.headers, timeout=10)
+        response = requests.get(self._health_url, headers=self.headers, timeout=10)
         return self._handle_response(response)
 
     def submit_turnstile(
@@ -269,7 +509,7 @@ class RapidCaptchaClient:
             payload["cdata"] = cdata
         
         response = requests.post(
-            f"{self.base_url}/api/solve/turnstile",
+            self._turnstile_url,
             headers=self.headers,
             json=payload,
             timeout=30
@@ -312,7 +552,7 @@ class RapidCaptchaClient:
             payload["sitekey"] = sitekey
         
         response = requests.post(
-            f"{self.base_url}/api/solve/recaptcha",
+            self._recaptcha_url,
             headers=self.headers,
             json=payload,
             timeout=30
@@ -341,29 +581,13 @@ class RapidCaptchaClient:
             raise ValidationError("Task ID is required")
         
         response = requests.get(
-            f"{self.base_url}/api/result/{task_id}",
+            self._result_url(task_id),
             headers={"X-API-Key": self.api_key},
             timeout=30
         )
         
         data = self._handle_response(response)
-        
-        # Parse result data
-        result_data = data.get("result", {})
-        status = TaskStatus(data.get("status", "pending"))
-        
-        return CaptchaResult(
-            task_id=data.get("task_id", task_id),
-            status=status,
-            token=result_data.get("token"),
-            turnstile_value=result_data.get("turnstile_value"),
-            elapsed_time_seconds=result_data.get("elapsed_time_seconds"),
-            sitekey_used=result_data.get("sitekey_used"),
-            sitekeys_tried=result_data.get("sitekeys_tried"),
-            reason=result_data.get("reason"),
-            errors=result_data.get("errors"),
-            completed_at=data.get("completed_at")
-        )
+        return self._parse_result(data, task_id)
 
     def wait_for_result(self, task_id: str, poll_interval: float = 2.0) -> CaptchaResult:
         """
@@ -379,9 +603,9 @@ class RapidCaptchaClient:
         Raises:
             TimeoutError: If task doesn't complete within timeout
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         
-        while time.time() - start_time < self.timeout:
+        while time.monotonic() - start_time < self.timeout:
             result = self.get_result(task_id)
             
             if result.is_success or result.is_error:
@@ -454,29 +678,91 @@ class RapidCaptchaClient:
         elif response.status == 429:
             raise RateLimitError("Rate limit exceeded")
         elif response.status == 400:
-            try:
-                error_data = await response.json()
+            error_data = await _read_error_async(response)
+            if isinstance(error_data, dict):
                 raise ValidationError(error_data.get('message', 'Bad request'))
-            except (json.JSONDecodeError, KeyError):
-                raise ValidationError("Bad request")
+            raise ValidationError("Bad request")
         elif response.status != expected_status:
-            try:
-                error_data = await response.json()
+            error_data = await _read_error_async(response)
+            if isinstance(error_data, dict):
                 raise RapidCaptchaError(f"API error: {error_data.get('message', 'Unknown error')}")
-            except:
-                text = await response.text()
-                raise RapidCaptchaError(f"HTTP {response.status}: {text}")
+            text = await response.text(errors="replace")
+            raise RapidCaptchaError(f"HTTP {response.status}: {text}")
+        
+        # ValueError covers json's and orjson's decode errors as well as
+        # json's UnicodeDecodeError for bodies that aren't UTF-8
+        try:
+            return _loads(await _read_body_async(response))
+        except ValueError:
+            raise RapidCaptchaError("Invalid JSON response from API")
+
+    async def _request_async(
+        self,
+        method: str,
+        url: str,
+        expected_status: Union[int, Tuple[int, ...]] = 200,
+        headers: Optional[Dict] = None,
+        timeout: float = 30,
+        long_poll: bool = False,
+        **kwargs
+    ) -> Dict:
+        """
+        Send a request with the configured async transport and handle the response
+        
+        expected_status may list several success statuses; any other status
+        is reported as an error against the last one. long_poll marks a
+        request the server may hold open, which aiohttp sends over its own
+        connection pool; over HTTP/2, httpx multiplexes it with other requests.
+        """
+        if headers is None:
+            headers = self.headers
         
-        return await response.json()
+        if self.transport == "httpx":
+            return await self._request_httpx(method, url, expected_status, headers, timeout, **kwargs)
+        return await self._request_aiohttp(method, url, expected_status, headers, timeout, long_poll, **kwargs)
+
+    async def _request_aiohttp(
+        self,
+        method: str,
+        url: str,
+        expected_status: Union[int, Tuple[int, ...]],
+        headers: Dict,
+        timeout: float,
+        long_poll: bool = False,
+        **kwargs
+    ) -> Dict:
+        """Send a request over the running loop's aiohttp session"""
+        session = self._get_session(long_poll)
+        async with session.request(method, url, headers=headers, timeout=timeout, **kwargs) as response:
+            return await self._handle_response_async(
+                response, _expected_status(response.status, expected_status)
+            )
+
+    async def _request_httpx(
+        self,
+        method: str,
+        url: str,
+        expected_status: Union[int, Tuple[int, ...]],
+        headers: Dict,
+        timeout: float,
+        **kwargs
+    ) -> Dict:
+        """Send a request over the running loop's HTTP/2 httpx client"""
+        if "json" in kwargs:
+            kwargs["content"] = _dumps(kwargs.pop("json"))
+        response = await self._get_httpx_client().request(
+            method, url, headers=headers, timeout=timeout, **kwargs
+        )
+        # httpx responses have the requests interface, so the sync handler applies
+        return self._handle_response(
+            response, _expected_status(response.status_code, expected_status)
+        )
 
     async def health_check_async(self) -> Dict:
         """Async version of health_check"""
-        if not HAS_AIOHTTP:
-            raise ImportError("aiohttp library is required for async operations. Install with: pip install aiohttp")
+        self._check_async_transport()
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.base_url}/", headers=self.headers, timeout=10) as response:
-                return await self._handle_response_async(response)
+        return await self._request_async("GET", self._health_url, timeout=10)
 
     async def submit_turnstile_async(
         self,
@@ -487,8 +773,19 @@ class RapidCaptchaClient:
         auto_detect: bool = True
     ) -> str:
         """Async version of submit_turnstile"""
-        if not HAS_AIOHTTP:
-            raise ImportError("aiohttp library is required for async operations. Install with: pip install aiohttp")
+        result = await self._submit_turnstile_async(url, sitekey, action, cdata, auto_detect)
+        return result["task_id"]
+
+    async def _submit_turnstile_async(
+        self,
+        url: str,
+        sitekey: Optional[str] = None,
+        action: Optional[str] = None,
+        cdata: Optional[str] = None,
+        auto_detect: bool = True,
+        server_wait: bool = False
+    ) -> Dict:
+        self._check_async_transport()
         
         self._validate_url(url)
         
@@ -507,15 +804,7 @@ class RapidCaptchaClient:
         if cdata:
             payload["cdata"] = cdata
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/api/solve/turnstile",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            ) as response:
-                result = await self._handle_response_async(response, 202)
-                return result["task_id"]
+        return await self._post_task_async(self._turnstile_url, payload, server_wait)
 
     async def submit_recaptcha_async(
         self,
@@ -524,8 +813,17 @@ class RapidCaptchaClient:
         auto_detect: bool = True
     ) -> str:
         """Async version of submit_recaptcha"""
-        if not HAS_AIOHTTP:
-            raise ImportError("aiohttp library is required for async operations. Install with: pip install aiohttp")
+        result = await self._submit_recaptcha_async(url, sitekey, auto_detect)
+        return result["task_id"]
+
+    async def _submit_recaptcha_async(
+        self,
+        url: str,
+        sitekey: Optional[str] = None,
+        auto_detect: bool = True,
+        server_wait: bool = False
+    ) -> Dict:
+        self._check_async_transport()
         
         self._validate_url(url)
         
@@ -540,60 +838,62 @@ class RapidCaptchaClient:
         if sitekey:
             payload["sitekey"] = sitekey
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/api/solve/recaptcha",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            ) as response:
-                result = await self._handle_response_async(response, 202)
-                return result["task_id"]
+        return await self._post_task_async(self._recaptcha_url, payload, server_wait)
+
+    async def _post_task_async(self, endpoint: str, payload: Dict, server_wait: bool = False) -> Dict:
+        """Submit a task, optionally asking the server to hold the request until it completes"""
+        if not server_wait:
+            return await self._request_async("POST", endpoint, 202, json=payload)
+        
+        # A server that supports long-polling answers 200 with the finished task;
+        # one that doesn't queues it as usual (202) and the caller polls
+        return await self._request_async(
+            "POST",
+            endpoint,
+            (200, 202),
+            json=payload,
+            params={"wait": "1"},
+            timeout=self.timeout,
+            long_poll=True
+        )
 
     async def get_result_async(self, task_id: str) -> CaptchaResult:
         """Async version of get_result"""
-        if not HAS_AIOHTTP:
-            raise ImportError("aiohttp library is required for async operations. Install with: pip install aiohttp")
+        self._check_async_transport()
         
         if not task_id:
             raise ValidationError("Task ID is required")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.base_url}/api/result/{task_id}",
-                headers={"X-API-Key": self.api_key},
-                timeout=30
-            ) as response:
-                data = await self._handle_response_async(response)
-                
-                # Parse result data
-                result_data = data.get("result", {})
-                status = TaskStatus(data.get("status", "pending"))
-                
-                return CaptchaResult(
-                    task_id=data.get("task_id", task_id),
-                    status=status,
-                    token=result_data.get("token"),
-                    turnstile_value=result_data.get("turnstile_value"),
-                    elapsed_time_seconds=result_data.get("elapsed_time_seconds"),
-                    sitekey_used=result_data.get("sitekey_used"),
-                    sitekeys_tried=result_data.get("sitekeys_tried"),
-                    reason=result_data.get("reason"),
-                    errors=result_data.get("errors"),
-                    completed_at=data.get("completed_at")
-                )
-
-    async def wait_for_result_async(self, task_id: str, poll_interval: float = 2.0) -> CaptchaResult:
-        """Async version of wait_for_result"""
-        start_time = time.time()
-        
-        while time.time() - start_time < self.timeout:
+        data = await self._request_async(
+            "GET", self._result_url(task_id), headers={"X-API-Key": self.api_key}
+        )
+        return self._parse_result(data, task_id)
+
+    async def wait_for_result_async(
+        self,
+        task_id: str,
+        poll_interval: float = 2.0,
+        max_interval: float = 2.0
+    ) -> CaptchaResult:
+        """
+        Async version of wait_for_result
+        
+        The first poll waits poll_interval and each pending result grows the
+        delay by 1.5x, up to max_interval (or poll_interval if that is larger).
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        delay = poll_interval
+        max_delay = max(poll_interval, max_interval)
+        
+        while loop.time() - start_time < self.timeout:
             result = await self.get_result_async(task_id)
             
             if result.is_success or result.is_error:
                 return result
             
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, max_delay)
         
         raise TimeoutError(f"Task {task_id} did not complete within {self.timeout} seconds")
 
@@ -604,22 +904,118 @@ class RapidCaptchaClient:
         action: Optional[str] = None,
         cdata: Optional[str] = None,
         auto_detect: bool = True,
-        poll_interval: float = 2.0
+        poll_interval: float = 2.0,
+        max_interval: float = 2.0,
+        server_wait: bool = False
     ) -> CaptchaResult:
-        """Async version of solve_turnstile"""
-        task_id = await self.submit_turnstile_async(url, sitekey, action, cdata, auto_detect)
-        return await self.wait_for_result_async(task_id, poll_interval)
+        """
+        Async version of solve_turnstile
+        
+        With server_wait, the submit request asks the API to respond once the
+        task has finished (``?wait=1``), saving the polling round-trips. If the
+        server queues the task instead, the result is polled as usual.
+        """
+        data = await self._submit_turnstile_async(url, sitekey, action, cdata, auto_detect, server_wait)
+        return await self._finish_task_async(data, poll_interval, max_interval)
 
     async def solve_recaptcha_async(
         self,
         url: str,
         sitekey: Optional[str] = None,
         auto_detect: bool = True,
-        poll_interval: float = 2.0
+        poll_interval: float = 2.0,
+        max_interval: float = 2.0,
+        server_wait: bool = False
+    ) -> CaptchaResult:
+        """Async version of solve_recaptcha (see solve_turnstile_async for server_wait)"""
+        data = await self._submit_recaptcha_async(url, sitekey, auto_detect, server_wait)
+        return await self._finish_task_async(data, poll_interval, max_interval)
+
+    async def _finish_task_async(
+        self,
+        data: Dict,
+        poll_interval: float,
+        max_interval: float
     ) -> CaptchaResult:
-        """Async version of solve_recaptcha"""
-        task_id = await self.submit_recaptcha_async(url, sitekey, auto_detect)
-        return await self.wait_for_result_async(task_id, poll_interval)
+        """Return a task completed by a long-polling submit, or poll for its result"""
+        task_id = data["task_id"]
+        if data.get("status") in (TaskStatus.SUCCESS.value, TaskStatus.ERROR.value):
+            return self._parse_result(data, task_id)
+        return await self.wait_for_result_async(task_id, poll_interval, max_interval)
+
+    async def solve_many_async(
+        self,
+        urls: List[str],
+        kind: Union[str, CaptchaType] = CaptchaType.TURNSTILE,
+        concurrency: int = 10,
+        return_exceptions: bool = True,
+        **kwargs
+    ) -> List[Union[CaptchaResult, BaseException]]:
+        """
+        Solve several CAPTCHAs concurrently with a bounded number of in-flight solves
+
+        Args:
+            urls: Target website URLs
+            kind: CAPTCHA type to solve ("turnstile" or "recaptcha")
+            concurrency: Maximum number of solves running at the same time
+            return_exceptions: Return failures in place of results. If False,
+                the first failure cancels the remaining solves and is raised
+            **kwargs: Additional arguments for each solve (sitekey, auto_detect, poll_interval, etc.)
+
+        Returns:
+            List with a CaptchaResult (or, with return_exceptions, the raised
+            exception) for each URL, in input order
+
+        Raises:
+            ValidationError: If kind or concurrency is invalid
+
+        Example:
+            >>> results = await client.solve_many_async(urls, concurrency=3)
+            >>> solved = [r for r in results if isinstance(r, CaptchaResult) and r.is_success]
+        """
+        try:
+            captcha_type = CaptchaType(kind)
+        except ValueError:
+            raise ValidationError(f"Unsupported CAPTCHA type: {kind}")
+
+        if concurrency < 1:
+            raise ValidationError("Concurrency must be at least 1")
+
+        solve: Callable[..., Awaitable[CaptchaResult]]
+        if captcha_type is CaptchaType.TURNSTILE:
+            solve = self.solve_turnstile_async
+        else:
+            solve = self.solve_recaptcha_async
+
+        semaphore = asyncio.BoundedSemaphore(concurrency)
+
+        async def solve_one(url: str) -> CaptchaResult:
+            async with semaphore:
+                return await solve(url, **kwargs)
+
+        if return_exceptions:
+            # Failures are returned in place so one error never abandons the
+            # other solves; gather gets ready tasks rather than coroutines to wrap
+            tasks = [asyncio.ensure_future(solve_one(url)) for url in urls]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        if sys.version_info >= (3, 11):
+            try:
+                async with asyncio.TaskGroup() as group:
+                    tasks = [group.create_task(solve_one(url)) for url in urls]
+            except BaseExceptionGroup as exc_group:  # noqa: F821 (Python 3.11+ only)
+                # Raise the failure that cancelled the batch, as on older Pythons
+                raise exc_group.exceptions[0] from exc_group
+            return [task.result() for task in tasks]
+
+        tasks = [asyncio.ensure_future(solve_one(url)) for url in urls]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
 
 # Convenience functions
@@ -702,14 +1098,15 @@ if __name__ == "__main__":
             print("\n🔄 Testing async capabilities...")
             
             async def test_async():
-                try:
-                    result = await client.solve_turnstile_async(
-                        url="https://2captcha.com/demo/cloudflare-turnstile",
-                        auto_detect=True
-                    )
-                    print(f"✅ Async Turnstile: {result.is_success}")
-                except Exception as e:
-                    print(f"❌ Async error: {e}")
+                async with RapidCaptchaClient(api_key) as async_client:
+                    try:
+                        result = await async_client.solve_turnstile_async(
+                            url="https://2captcha.com/demo/cloudflare-turnstile",
+                            auto_detect=True
+                        )
+                        print(f"✅ Async Turnstile: {result.is_success}")
+                    except Exception as e:
+                        print(f"❌ Async error: {e}")
             
             asyncio.run(test_async())
         
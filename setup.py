@@ -53,9 +53,11 @@ setup(
     ],
     extras_require={
         "async": ["aiohttp>=3.8.0"],
+        "speedups": ["orjson>=3.6.0"],
+        "http2": ["httpx[http2]>=0.23.0"],
         "dev": [
             "pytest>=6.0",
-            "pytest-asyncio>=0.18.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-cov>=3.0.0",
             "black>=22.0",
             "flake8>=4.0",
@@ -66,11 +68,15 @@ setup(
         ],
         "test": [
             "pytest>=6.0",
-            "pytest-asyncio>=0.18.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-mock>=3.6.0",
             "pytest-cov>=3.0.0",
+            "pytest-benchmark>=4.0.0",
+            "pytest-xdist>=2.5.0",
             "responses>=0.18.0",
-            "aioresponses>=0.7.0",
+            "aioresponses>=0.7.0,!=0.7.9",
+            "httpx[http2]>=0.23.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
         ],
     },
     keywords=[
@@ -12,6 +12,9 @@ Test files:
 - test_client.py: Synchronous client functionality tests
 - test_async.py: Asynchronous client functionality tests
 - test_errors.py: Error handling and exception tests
+- test_benchmark.py: pytest-benchmark timings for async operations
+- conftest.py: Shared fixtures (module-wide async client)
+- mock_api.py: Mocked API routes shared by the async tests and benchmarks
 
 Usage:
     # Run all tests
@@ -26,6 +29,10 @@ Usage:
     # Run async tests only
     pytest tests/test_async.py
     
+    # Run across workers; loadfile keeps each module's mocks on one worker
+    # (leave it off for the benchmark, which needs a serial run)
+    pytest tests/ -n auto --dist loadfile --ignore=tests/test_benchmark.py
+    
     # Run with verbose output
     pytest tests/ -v
 """
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Shared fixtures for the RapidCaptcha test suite
+"""
+
+import sys
+
+import pytest
+import pytest_asyncio
+
+from rapidcaptcha import RapidCaptchaClient
+
+try:
+    import uvloop
+    HAS_UVLOOP = sys.platform != "win32"
+except ImportError:
+    HAS_UVLOOP = False
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def client():
+    """Single client (and aiohttp session) shared by every test in a module"""
+    async with RapidCaptchaClient("Rapidcaptcha-test-key") as c:
+        yield c
+
+
+# pytest-asyncio 1.4 takes loop factories from a hook and deprecates
+# overriding event_loop_policy, which older releases need instead
+HAS_LOOP_FACTORY_HOOK = tuple(int(part) for part in pytest_asyncio.__version__.split(".")[:2]) >= (1, 4)
+
+if HAS_UVLOOP and HAS_LOOP_FACTORY_HOOK:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop; mocked tests are dominated by loop scheduling"""
+        return {"uvloop": uvloop.new_event_loop}
+elif HAS_UVLOOP:
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run async tests on uvloop; mocked tests are dominated by loop scheduling"""
+        return uvloop.EventLoopPolicy()
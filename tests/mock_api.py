@@ -0,0 +1,223 @@
+"""
+Mocked RapidCaptcha API shared by the async tests and benchmarks
+
+The same routes answer aioresponses-patched requests, an in-process aiohttp
+server over loopback and an httpx MockTransport.
+"""
+
+import itertools
+import json
+import re
+from collections import Counter
+from aioresponses import CallbackResult
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from yarl import URL
+
+
+API_KEY = "Rapidcaptcha-test-key"
+API_URL = "https://rapidcaptcha.xyz"
+
+# Requests to the in-process API server bypass aioresponses
+LOCAL_HOST = "127.0.0.1"
+
+# Target URL -> (status, payload) answered by the solve endpoints
+SUBMISSIONS = {
+    "https://example.com/immediate-error": (202, {"task_id": "immediate-error-task"}),
+    "https://example1.com": (202, {"task_id": "exception-task-1"}),
+    "https://example2.com": (429, {"error": "Rate limit exceeded"}),
+    "https://example3.com": (202, {"task_id": "exception-task-3"}),
+    "https://example.com/context": (202, {"task_id": "context-task"}),
+    "https://example.com/server-error-page": (500, "Internal Server Error"),
+    "https://example.com/server-wait": (202, {"task_id": "server-wait-task"}),
+    "https://example.com/status-400": (400, {"message": "Async invalid URL format"}),
+    "https://example.com/status-500": (500, {"message": "Async internal server error"}),
+    "https://example.com/status-500-list": (500, "[1,2]"),
+    "https://example.com/status-400-null": (400, "null"),
+}
+
+# Target URL -> finished task answered by the solve endpoints when the
+# submit asks the server to wait (?wait=1); other URLs are queued as usual
+COMPLETED_SUBMISSIONS = {
+    "https://example.com/server-wait": {
+        "task_id": "server-wait-task",
+        "status": "success",
+        "result": {"turnstile_value": "0.server-wait...", "elapsed_time_seconds": 8.0}
+    },
+}
+
+# Target URL -> task ID prefix for URLs that may be submitted many times.
+# Every submission gets a fresh "<prefix>-<n>" task whose successful result
+# is added to GENERATED_RESULTS as it is submitted.
+GENERATED_TASKS = {
+    "https://example.com/batch": "batch-task",
+    "https://example.com/perf": "perf-task",
+}
+TASK_COUNTER = itertools.count(1)
+GENERATED_RESULTS = {}
+
+# Task ID -> payload answered by the result endpoint. A list of payloads is
+# served one per poll, repeating the last one.
+RESULTS = {
+    "immediate-error-task": {
+        "task_id": "immediate-error-task",
+        "status": "error",
+        "result": {
+            "reason": "Invalid sitekey format",
+            "errors": ["Sitekey validation failed"]
+        }
+    },
+    "exception-task-1": {
+        "task_id": "exception-task-1",
+        "status": "success",
+        "result": {"turnstile_value": "0.success..."}
+    },
+    "exception-task-3": {
+        "task_id": "exception-task-3",
+        "status": "success",
+        "result": {"turnstile_value": "0.success2..."}
+    },
+    "context-task": {
+        "task_id": "context-task",
+        "status": "success",
+        "result": {"turnstile_value": "0.context..."}
+    },
+    "polled-task": [{"task_id": "polled-task", "status": "pending"}] * 4 + [{
+        "task_id": "polled-task",
+        "status": "success",
+        "result": {"turnstile_value": "0.polled..."}
+    }],
+    "pending-task": {"task_id": "pending-task", "status": "pending"},
+    "success-task": {
+        "task_id": "success-task",
+        "status": "success",
+        "result": {
+            "turnstile_value": "0.abc123def456...",
+            "elapsed_time_seconds": 15.5,
+            "sitekey_used": "0x4AAAAAAABkMYinukE8nzKd"
+        },
+        "completed_at": "2024-01-15T10:30:00Z"
+    },
+    "error-task": {
+        "task_id": "error-task",
+        "status": "error",
+        "result": {
+            "reason": "Sitekey not found",
+            "errors": ["Invalid sitekey", "Page load failed"],
+            "sitekeys_tried": ["0x4AAAAAAABkMYinukE8nzKd"]
+        }
+    },
+    "invalid-json-task": "Invalid JSON response <html>Error page</html>",
+    "non-utf8-task": b"\xff\xfe<html>Error page</html>",
+    "large-result-task": {
+        "task_id": "large-result-task",
+        "status": "error",
+        "result": {"errors": [f"Sitekey 0x{n:022d} rejected" for n in range(4096)]}
+    },
+}
+POLLS = Counter()
+
+
+def _authenticated(handler):
+    """Wrap a route handler so requests with an unknown API key get a 401"""
+    def callback(url, **kwargs):
+        if kwargs["headers"].get("X-API-Key") != API_KEY:
+            return CallbackResult(status=401, payload={"error": "Invalid API key"})
+        status, payload = handler(url, **kwargs)
+        if isinstance(payload, str):
+            body = payload.encode()
+        elif isinstance(payload, bytes):
+            body = payload
+        else:
+            body = json.dumps(payload).encode()
+        # Sent by the real API; aioresponses leaves it out unless given
+        headers = {"Content-Length": str(len(body))}
+        return CallbackResult(status=status, body=body, headers=headers)
+    return callback
+
+
+@_authenticated
+def _health(url, **kwargs):
+    return 200, {"status": "ok", "message": "API is healthy"}
+
+
+@_authenticated
+def _submit(url, **kwargs):
+    target = kwargs["json"]["url"]
+    if url.query.get("wait") == "1" and target in COMPLETED_SUBMISSIONS:
+        return 200, COMPLETED_SUBMISSIONS[target]
+    if target in GENERATED_TASKS:
+        return 202, {"task_id": _generate_task(GENERATED_TASKS[target])}
+    return SUBMISSIONS[target]
+
+
+def _generate_task(prefix):
+    """Register a new successful task in GENERATED_RESULTS and return its ID"""
+    task_id = f"{prefix}-{next(TASK_COUNTER)}"
+    GENERATED_RESULTS[task_id] = {
+        "task_id": task_id,
+        "status": "success",
+        "result": {
+            "turnstile_value": f"0.{task_id}...",
+            "elapsed_time_seconds": 10.0
+        }
+    }
+    return task_id
+
+
+@_authenticated
+def _result(url, **kwargs):
+    task_id = url.path.rsplit("/", 1)[-1]
+    payload = RESULTS.get(task_id, GENERATED_RESULTS.get(task_id))
+    if payload is None:
+        return 404, {"error": "Task not found or expired"}
+    if isinstance(payload, list):
+        payload = payload[min(POLLS[task_id], len(payload) - 1)]
+        POLLS[task_id] += 1
+    return 200, payload
+
+
+ROUTES = [
+    ("GET", f"{API_URL}/", _health),
+    ("POST", re.compile(rf"^{re.escape(API_URL)}/api/solve/(turnstile|recaptcha)(\?wait=1)?$"), _submit),
+    ("GET", re.compile(rf"^{re.escape(API_URL)}/api/result/[^/]+$"), _result),
+]
+
+
+def register_all(m):
+    """Install every route once; responses are looked up per request"""
+    for method, url, callback in ROUTES:
+        m.add(url, method=method, callback=callback, repeat=True)
+
+
+def dispatch(method, url, headers, body):
+    """Answer a request from ROUTES, or return None if no route matches"""
+    for route_method, pattern, callback in ROUTES:
+        if isinstance(pattern, str):
+            matched = str(url) == pattern
+        else:
+            matched = pattern.match(str(url)) is not None
+        if route_method == method and matched:
+            return callback(url, headers=headers, json=body)
+    return None
+
+
+async def _serve(request):
+    body = await request.json() if request.can_read_body else None
+    result = dispatch(request.method, URL(API_URL + request.path_qs), request.headers, body)
+    if result is None:
+        return web.Response(status=404)
+    return web.Response(status=result.status, body=result.body, content_type="application/json")
+
+
+def local_server():
+    """In-process HTTP server answering the mocked API routes over loopback"""
+    app = web.Application()
+    app.router.add_route("*", "/{path:.*}", _serve)
+    return TestServer(app, host=LOCAL_HOST)
+
+
+def reset():
+    """Forget poll counts and generated tasks, restoring the scripted tables"""
+    POLLS.clear()
+    GENERATED_RESULTS.clear()
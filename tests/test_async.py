@@ -3,311 +3,573 @@ Test cases for RapidCaptcha client asynchronous operations
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 import json
 import time
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 import aioresponses
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from yarl import URL
 
 from rapidcaptcha import (
     RapidCaptchaClient, CaptchaResult, TaskStatus,
-    APIKeyError, ValidationError, TaskNotFoundError,
+    RapidCaptchaError, APIKeyError, ValidationError, TaskNotFoundError,
     RateLimitError, TimeoutError
 )
 
+from . import mock_api
+from .mock_api import API_KEY, LOCAL_HOST, dispatch, local_server, register_all
 
-pytestmark = pytest.mark.asyncio
+
+# Every test shares one session-scoped loop and the module's mocked API
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.usefixtures("mocked"),
+]
+
+
+@pytest.fixture(scope="module")
+def mocked():
+    """Mocked RapidCaptcha API shared by every test in the module"""
+    with aioresponses.aioresponses(passthrough=[f"http://{LOCAL_HOST}"]) as m:
+        register_all(m)
+        yield m
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_api():
+    """Forget poll counts and generated tasks once each test finishes"""
+    yield
+    mock_api.reset()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def local_api():
+    """Base URL of a real local API server, for tests of concurrent request behavior"""
+    server = local_server()
+    await server.start_server()
+    yield str(server.make_url("")).rstrip("/")
+    await server.close()
+
+
+@pytest.fixture
+def no_aiohttp(monkeypatch):
+    """Make the client behave as if aiohttp were not installed"""
+    monkeypatch.setattr("rapidcaptcha.client.HAS_AIOHTTP", False)
+
+
+@pytest.fixture(scope="module")
+def httpx_clients():
+    """Route httpx transport requests to the mocked API, recording client options"""
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    created = []
+    
+    def handler(request):
+        body = json.loads(request.content) if request.content else None
+        result = dispatch(request.method, URL(str(request.url)), request.headers, body)
+        if result is None:
+            return httpx.Response(404)
+        return httpx.Response(result.status, content=result.body)
+    
+    real_client = httpx.AsyncClient
+    transport = httpx.MockTransport(handler)
+    
+    def make_client(**kwargs):
+        created.append(kwargs)
+        return real_client(transport=transport, **kwargs)
+    
+    # Patched once for the module, like the aioresponses mock
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("rapidcaptcha.client.httpx.AsyncClient", make_client)
+        yield created
 
 
 class TestAsyncHealthCheck:
     """Test async health check functionality"""
     
-    async def test_health_check_async_success(self):
+    async def test_health_check_async_success(self, client):
         """Test successful async health check"""
-        client = RapidCaptchaClient("Rapidcaptcha-test-key")
+        result = await client.health_check_async()
         
-        with aioresponses.aioresponses() as m:
-            m.get(
-                "https://rapidcaptcha.xyz/",
-                payload={"status": "ok", "message": "API is healthy"},
-                status=200
-            )
-            
-            result = await client.health_check_async()
-            
-            assert result["status"] == "ok"
-            assert result["message"] == "API is healthy"
+        assert result["status"] == "ok"
+        assert result["message"] == "API is healthy"
     
     async def test_health_check_async_api_key_error(self):
         """Test async health check with invalid API key"""
-        client = RapidCaptchaClient("Rapidcaptcha-test-key")
-        
-        with aioresponses.aioresponses() as m:
-            m.get(
-                "https://rapidcaptcha.xyz/",
-                payload={"error": "Invalid API key"},
-                status=401
-            )
-            m.post(
-                "https://rapidcaptcha.xyz/api/solve/turnstile",
-                payload={"error": "Invalid API key"},
-                status=401
-            )
+        async with RapidCaptchaClient("Rapidcaptcha-invalid-key") as client:
+            with pytest.raises(APIKeyError, match="Invalid API key"):
+                await client.health_check_async()
+            
             with pytest.raises(APIKeyError, match="Invalid API key"):
                 await client.submit_turnstile_async("https://example.com", auto_detect=True)
 
 
-class TestAsyncSemaphoreRateLimit:
-    """Test async operations with semaphore for rate limiting"""
-    
-    async def test_batch_processing_with_semaphore(self):
-        """Test batch processing with semaphore to respect rate limits"""
-        client = RapidCaptchaClient("Rapidcaptcha-test-key")
-        
-        # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(2)  # Max 2 concurrent requests
-        
-        async def solve_with_semaphore(url, task_num):
-            """Solve with semaphore to respect rate limits"""
-            async with semaphore:
-                return await client.solve_turnstile_async(url, auto_detect=True)
-        
-        urls = ["https://example.com"] * 4  # 4 identical URLs for demo
-        
-        with aioresponses.aioresponses() as m:
-            # Setup responses for all tasks
-            for i in range(1, 5):
-                m.post(
-                    "https://rapidcaptcha.xyz/api/solve/turnstile",
-                    payload={"task_id": f"batch-task-{i}"},
-                    status=202
-                )
-                m.get(
-                    f"https://rapidcaptcha.xyz/api/result/batch-task-{i}",
-                    payload={
-                        "task_id": f"batch-task-{i}",
-                        "status": "success",
-                        "result": {
-                            "turnstile_value": f"0.batch{i}...",
-                            "elapsed_time_seconds": 10.0
-                        }
-                    },
-                    status=200
-                )
+class TestAsyncRateLimit:
+    """Test async operations with concurrency limits for rate limiting"""
+    
+    async def test_batch_processing_with_connection_limit(self, local_api):
+        """Test batch processing with a connection limit to respect rate limits"""
+        urls = ["https://example.com/batch"] * 4  # 4 identical URLs for demo
+        
+        # Max 2 concurrent connections, exercised against a real server
+        async with RapidCaptchaClient(API_KEY, base_url=local_api, max_concurrent=2) as client:
+            start_time = time.perf_counter()
+            results = await client.solve_many_async(urls)
+            elapsed = time.perf_counter() - start_time
             
-            # Process all URLs with rate limiting
-            start_time = time.time()
-            tasks = [
-                solve_with_semaphore(url, i) 
-                for i, url in enumerate(urls, 1)
-            ]
-            results = await asyncio.gather(*tasks)
-            elapsed = time.time() - start_time
+            connector = client._get_session().connector
+            assert connector.limit == 2
+            assert connector.limit_per_host == 2
+        
+        # All should succeed
+        successful = sum(1 for r in results if r and r.is_success)
+        assert successful == 4
+        assert len({r.task_id for r in results}) == 4
+        
+        # Should not take long over loopback
+        assert elapsed < 5.0
+    
+    async def test_submit_turnstile_async_concurrent(self, client):
+        """Test that concurrent submissions each get their own task"""
+        argsets = [
+            ("https://example.com/batch", True),
+            ("https://example.com/batch", True),
+            ("https://example.com/batch", True),
+        ]
+        tasks = [
+            asyncio.ensure_future(client.submit_turnstile_async(url, auto_detect=auto_detect))
+            for url, auto_detect in argsets
+        ]
+        task_ids = await asyncio.gather(*tasks)
+        
+        assert len(set(task_ids)) == 3
+        assert all(task_id.startswith("batch-task-") for task_id in task_ids)
+    
+    async def test_solve_many_async_respects_concurrency(self, client):
+        """Test that solve_many_async never exceeds the concurrency limit"""
+        active = 0
+        peak = 0
+        
+        async def fake_solve(url, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return url
+        
+        with patch.object(client, "solve_turnstile_async", fake_solve):
+            results = await client.solve_many_async(["https://example.com"] * 6, concurrency=2)
+        
+        assert results == ["https://example.com"] * 6
+        assert peak == 2
+    
+    async def test_solve_many_async_recaptcha(self, client):
+        """Test that kind selects the reCAPTCHA solver"""
+        with patch.object(client, "solve_recaptcha_async", return_value="recaptcha") as solve:
+            results = await client.solve_many_async(["https://example.com"], kind="recaptcha")
+        
+        assert results == ["recaptcha"]
+        solve.assert_awaited_once_with("https://example.com")
+    
+    async def test_solve_many_async_fail_fast(self, client):
+        """Test that the first failure cancels the remaining solves"""
+        cancelled = []
+        
+        async def fake_solve(url, **kwargs):
+            if url == "https://example2.com":
+                raise RateLimitError("Rate limit exceeded")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+        
+        urls = ["https://example1.com", "https://example2.com", "https://example3.com"]
+        
+        start_time = time.perf_counter()
+        with patch.object(client, "solve_turnstile_async", fake_solve):
+            with pytest.raises(RateLimitError, match="Rate limit exceeded"):
+                await client.solve_many_async(urls, return_exceptions=False)
+        
+        assert time.perf_counter() - start_time < 1.0
+        assert sorted(cancelled) == ["https://example1.com", "https://example3.com"]
+    
+    async def test_solve_many_async_fail_fast_success(self, client):
+        """Test that fail-fast mode returns results in input order"""
+        results = await client.solve_many_async(
+            [
+                "https://example.com/context",
+                "https://example1.com",
+                "https://example.com/immediate-error"
+            ],
+            return_exceptions=False
+        )
+        
+        assert [r.task_id for r in results] == [
+            "context-task", "exception-task-1", "immediate-error-task"
+        ]
+    
+    async def test_solve_many_async_invalid_arguments(self, client):
+        """Test solve_many_async argument validation"""
+        with pytest.raises(ValidationError, match="Unsupported CAPTCHA type"):
+            await client.solve_many_async(["https://example.com"], kind="hcaptcha")
+        
+        with pytest.raises(ValidationError, match="Concurrency must be at least 1"):
+            await client.solve_many_async(["https://example.com"], concurrency=0)
+
+
+class TestAsyncGetResult:
+    """Test async result retrieval"""
+    
+    @pytest.mark.parametrize("task_id,expected", [
+        ("success-task", {
+            "status": TaskStatus.SUCCESS,
+            "turnstile_value": "0.abc123def456...",
+            "elapsed_time_seconds": 15.5,
+            "sitekey_used": "0x4AAAAAAABkMYinukE8nzKd",
+            "completed_at": "2024-01-15T10:30:00Z",
+            "is_success": True,
+        }),
+        ("pending-task", {
+            "status": TaskStatus.PENDING,
+            "is_pending": True,
+        }),
+        ("error-task", {
+            "status": TaskStatus.ERROR,
+            "reason": "Sitekey not found",
+            "errors": ["Invalid sitekey", "Page load failed"],
+            "sitekeys_tried": ["0x4AAAAAAABkMYinukE8nzKd"],
+            "is_error": True,
+        }),
+    ], ids=["success", "pending", "error"])
+    async def test_get_result_async(self, client, task_id, expected):
+        """Test async result retrieval for each task status"""
+        result = await client.get_result_async(task_id)
+        
+        assert result.task_id == task_id
+        for flag in ("is_success", "is_pending", "is_error"):
+            assert getattr(result, flag) == expected.get(flag, False)
+        for attr, value in expected.items():
+            assert getattr(result, attr) == value
+
+
+class TestAsyncWaitForResult:
+    """Test async polling for task results"""
+    
+    async def test_wait_for_result_async_success(self, client):
+        """Test that polling backs off exponentially up to max_interval"""
+        sleep = AsyncMock()
+        
+        with patch.object(asyncio, "sleep", sleep):
+            result = await client.wait_for_result_async(
+                "polled-task", poll_interval=0.1, max_interval=0.2
+            )
+        
+        assert result.is_success
+        assert result.turnstile_value == "0.polled..."
+        
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert delays == pytest.approx([0.1, 0.15, 0.2, 0.2])
+    
+    async def test_wait_for_result_async_timeout(self):
+        """Test async wait_for_result timeout"""
+        async with RapidCaptchaClient(API_KEY, timeout=0.2) as client:
+            with pytest.raises(TimeoutError, match="did not complete within 0.2 seconds"):
+                await client.wait_for_result_async("pending-task", poll_interval=0.05)
+
+
+class TestAsyncServerWait:
+    """Test solving with a long-polling submit"""
+    
+    async def test_solve_turnstile_async_server_wait(self, client):
+        """Test that a submit answered with the finished task skips polling"""
+        # server-wait-task has no result endpoint entry, so polling would 404
+        result = await client.solve_turnstile_async(
+            "https://example.com/server-wait", server_wait=True
+        )
+        
+        assert result.is_success
+        assert result.task_id == "server-wait-task"
+        assert result.turnstile_value == "0.server-wait..."
+        assert result.elapsed_time_seconds == 8.0
+    
+    async def test_solve_turnstile_async_server_wait_fallback(self, client):
+        """Test that a queued task is polled when the server doesn't wait"""
+        result = await client.solve_turnstile_async(
+            "https://example.com/context", server_wait=True
+        )
+        
+        assert result.is_success
+        assert result.turnstile_value == "0.context..."
+    
+    async def test_server_wait_does_not_block_other_requests(self):
+        """Test that a held-open submit leaves the pool free for other requests"""
+        received = asyncio.Event()
+        release = asyncio.Event()
+        
+        async def hold_submit(request):
+            received.set()
+            await release.wait()
+            return web.json_response({"task_id": "held-task"}, status=202)
+        
+        async def health(request):
+            return web.json_response({"status": "ok"})
+        
+        app = web.Application()
+        app.router.add_post("/api/solve/turnstile", hold_submit)
+        app.router.add_get("/", health)
+        server = TestServer(app, host=LOCAL_HOST)
+        await server.start_server()
+        
+        base_url = str(server.make_url("")).rstrip("/")
+        async with RapidCaptchaClient(API_KEY, base_url=base_url, max_concurrent=1) as client:
+            submit = asyncio.ensure_future(
+                client._submit_turnstile_async("https://example.com", server_wait=True)
+            )
+            await received.wait()
             
-            # All should succeed
-            successful = sum(1 for r in results if r and r.is_success)
-            assert successful == 4
+            # With one pooled connection shared, this would wait on the long-poll
+            health = await asyncio.wait_for(client.health_check_async(), 2)
             
-            # Verify semaphore worked (should take some time due to rate limiting)
-            assert elapsed < 5.0  # But not too long due to mocking
+            release.set()
+            assert (await submit)["task_id"] == "held-task"
+        
+        await server.close()
+        assert health == {"status": "ok"}
+    
+    async def test_solve_turnstile_async_without_server_wait(self, client):
+        """Test that a plain submit doesn't ask the server to wait"""
+        with pytest.raises(TaskNotFoundError):
+            await client.solve_turnstile_async("https://example.com/server-wait")
 
 
 class TestAsyncImportError:
     """Test behavior when aiohttp library is not available"""
     
-    async def test_submit_turnstile_async_no_aiohttp(self):
-        """Test async submit turnstile without aiohttp library"""
-        client = RapidCaptchaClient("Rapidcaptcha-test-key")
-        
-        with patch('rapidcaptcha.client.HAS_AIOHTTP', False):
-            with pytest.raises(ImportError, match="aiohttp library is required"):
-                await client.submit_turnstile_async("https://example.com", auto_detect=True)
-    
-    async def test_submit_recaptcha_async_no_aiohttp(self):
-        """Test async submit recaptcha without aiohttp library"""
-        client = RapidCaptchaClient("Rapidcaptcha-test-key")
-        
-        with patch('rapidcaptcha.client.HAS_AIOHTTP', False):
-            with pytest.raises(ImportError, match="aiohttp library is required"):
-                await client.submit_recaptcha_async("https://example.com", auto_detect=True)
+    @pytest.mark.parametrize("coro_factory", [
+        lambda c: c.health_check_async(),
+        lambda c: c.submit_turnstile_async("https://example.com", auto_detect=True),
+        lambda c: c.submit_recaptcha_async("https://example.com", auto_detect=True),
+        lambda c: c.get_result_async("test-task-123"),
+    ], ids=["health_check", "submit_turnstile", "submit_recaptcha", "get_result"])
+    async def test_async_method_no_aiohttp(self, client, no_aiohttp, coro_factory):
+        """Test async methods without aiohttp library"""
+        with pytest.raises(ImportError, match="aiohttp library is required"):
+            await coro_factory(client)
+
+
+class TestAsyncErrorHandling:
+    """Test error handling in async responses"""
     
-    async def test_get_result_async_no_aiohttp(self):
-        """Test async get result without aiohttp library"""
-        client = RapidCaptchaClient("Rapidcaptcha-test-key")
+    @pytest.mark.parametrize("case,message,exc", [
+        ("400", "Async invalid URL format", ValidationError),
+        ("500", "API error: Async internal server error", RapidCaptchaError),
+        ("400-null", "Bad request", ValidationError),
+        ("500-list", "HTTP 500: [1,2]", RapidCaptchaError),
+    ], ids=["validation_error", "unknown_error", "validation_error_not_object", "unknown_error_not_object"])
+    async def test_handle_response_async_error(self, client, case, message, exc):
+        """Test handling error responses by status code"""
+        with pytest.raises(exc) as exc_info:
+            await client.submit_turnstile_async(f"https://example.com/status-{case}")
         
-        with patch('rapidcaptcha.client.HAS_AIOHTTP', False):
-            with pytest.raises(ImportError, match="aiohttp library is required"):
-                await client.get_result_async("test-task-123")
+        assert str(exc_info.value) == message
 
 
 class TestAsyncEdgeCases:
     """Test async edge cases and error scenarios"""
     
-    async def test_solve_turnstile_async_immediate_error(self):
+    async def test_solve_turnstile_async_immediate_error(self, client):
         """Test async Turnstile solving with immediate error"""
-        client = RapidCaptchaClient("Rapidcaptcha-test-key")
-        
-        with aioresponses.aioresponses() as m:
-            # Submit response
-            m.post(
-                "https://rapidcaptcha.xyz/api/solve/turnstile",
-                payload={"task_id": "immediate-error-task"},
-                status=202
-            )
-            
-            # Result response - immediate error
-            m.get(
-                "https://rapidcaptcha.xyz/api/result/immediate-error-task",
-                payload={
-                    "task_id": "immediate-error-task",
-                    "status": "error",
-                    "result": {
-                        "reason": "Invalid sitekey format",
-                        "errors": ["Sitekey validation failed"]
-                    }
-                },
-                status=200
+        result = await client.solve_turnstile_async(
+            "https://example.com/immediate-error", auto_detect=True
+        )
+        
+        assert result.is_error
+        assert result.reason == "Invalid sitekey format"
+        assert result.errors == ["Sitekey validation failed"]
+    
+    async def test_get_result_async_task_not_found(self, client):
+        """Test async get result for an unknown task"""
+        with pytest.raises(TaskNotFoundError, match="Task not found"):
+            await client.get_result_async("non-existent-task")
+    
+    async def test_get_result_async_invalid_json(self, client):
+        """Test async get result with a non-JSON response body"""
+        with pytest.raises(RapidCaptchaError, match="Invalid JSON response"):
+            await client.get_result_async("invalid-json-task")
+    
+    async def test_get_result_async_non_utf8(self, client):
+        """Test async get result with a body that isn't valid UTF-8"""
+        with pytest.raises(RapidCaptchaError, match="Invalid JSON response"):
+            await client.get_result_async("non-utf8-task")
+    
+    async def test_get_result_async_large_payload(self, client):
+        """Test a result body too large to be streamed into one buffer"""
+        result = await client.get_result_async("large-result-task")
+        
+        assert result.is_error
+        assert len(result.errors) == 4096
+        assert result.errors[-1] == f"Sitekey 0x{4095:022d} rejected"
+    
+    async def test_submit_turnstile_async_error_page(self, client):
+        """Test async submit with a non-JSON error response"""
+        with pytest.raises(RapidCaptchaError, match="HTTP 500: Internal Server Error"):
+            await client.submit_turnstile_async(
+                "https://example.com/server-error-page", auto_detect=True
             )
-            
-            result = await client.solve_turnstile_async("https://example.com", auto_detect=True)
-            
-            assert result.is_error
-            assert result.reason == "Invalid sitekey format"
-            assert result.errors == ["Sitekey validation failed"]
     
-    async def test_solve_multiple_with_exceptions(self):
+    async def test_solve_multiple_with_exceptions(self, client):
         """Test solving multiple CAPTCHAs where some raise exceptions"""
-        client = RapidCaptchaClient("Rapidcaptcha-test-key")
-        
-        with aioresponses.aioresponses() as m:
-            # Task 1: Success
-            m.post(
-                "https://rapidcaptcha.xyz/api/solve/turnstile",
-                payload={"task_id": "exception-task-1"},
-                status=202
-            )
-            m.get(
-                "https://rapidcaptcha.xyz/api/result/exception-task-1",
-                payload={
-                    "task_id": "exception-task-1",
-                    "status": "success",
-                    "result": {"turnstile_value": "0.success..."}
-                },
-                status=200
-            )
-            
-            # Task 2: Rate limit error
-            m.post(
-                "https://rapidcaptcha.xyz/api/solve/turnstile",
-                payload={"error": "Rate limit exceeded"},
-                status=429
-            )
-            
-            # Task 3: Success
-            m.post(
-                "https://rapidcaptcha.xyz/api/solve/turnstile",
-                payload={"task_id": "exception-task-3"},
-                status=202
-            )
-            m.get(
-                "https://rapidcaptcha.xyz/api/result/exception-task-3",
-                payload={
-                    "task_id": "exception-task-3",
-                    "status": "success",
-                    "result": {"turnstile_value": "0.success2..."}
-                },
-                status=200
+        # Task 1: Success, Task 2: Rate limit error, Task 3: Success
+        results = await client.solve_many_async([
+            "https://example1.com",
+            "https://example2.com",
+            "https://example3.com"
+        ])
+        
+        # Check results
+        r0, r1, r2 = results
+        assert r0.is_success
+        assert r0.turnstile_value == "0.success..."
+        
+        assert isinstance(r1, RateLimitError)
+        
+        assert r2.is_success
+        assert r2.turnstile_value == "0.success2..."
+    
+    async def test_async_context_manager(self):
+        """Test async operation using the client as an async context manager"""
+        async with RapidCaptchaClient(API_KEY) as client:
+            result = await client.solve_turnstile_async(
+                "https://example.com/context", auto_detect=True
             )
-            
-            # Solve with exception handling
-            tasks = [
-                client.solve_turnstile_async("https://example1.com", auto_detect=True),
-                client.solve_turnstile_async("https://example2.com", auto_detect=True),
-                client.solve_turnstile_async("https://example3.com", auto_detect=True)
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Check results
-            assert results[0].is_success
-            assert results[0].turnstile_value == "0.success..."
-            
-            assert isinstance(results[1], RateLimitError)
-            
-            assert results[2].is_success
-            assert results[2].turnstile_value == "0.success2..."
-    
-    async def test_async_context_manager_simulation(self):
-        """Test async operation in context manager style"""
-        async def async_solve_context():
-            """Simulate using client in async context"""
-            client = RapidCaptchaClient("Rapidcaptcha-test-key")
-            
-            with aioresponses.aioresponses() as m:
-                m.post(
-                    "https://rapidcaptcha.xyz/api/solve/turnstile",
-                    payload={"task_id": "context-task"},
-                    status=202
-                )
-                m.get(
-                    "https://rapidcaptcha.xyz/api/result/context-task",
-                    payload={
-                        "task_id": "context-task",
-                        "status": "success",
-                        "result": {"turnstile_value": "0.context..."}
-                    },
-                    status=200
-                )
-                
-                return await client.solve_turnstile_async("https://example.com", auto_detect=True)
-        
-        result = await async_solve_context()
+            session = client._get_session()
+        
         assert result.is_success
         assert result.turnstile_value == "0.context..."
+        assert session.closed
+        assert not client._sessions
 
 
-class TestAsyncPerformance:
-    """Test async performance characteristics"""
-    
-    async def test_concurrent_vs_sequential_performance(self):
-        """Compare concurrent vs sequential solving performance"""
-        client = RapidCaptchaClient("Rapidcaptcha-test-key")
-        
-        urls = ["https://example.com"] * 3
-        
-        with aioresponses.aioresponses() as m:
-            # Setup responses for all tasks
-            for i in range(1, 4):
-                m.post(
-                    "https://rapidcaptcha.xyz/api/solve/turnstile",
-                    payload={"task_id": f"perf-task-{i}"},
-                    status=202
-                )
-                m.get(
-                    f"https://rapidcaptcha.xyz/api/result/perf-task-{i}",
-                    payload={
-                        "task_id": f"perf-task-{i}",
-                        "status": "success",
-                        "result": {"turnstile_value": f"0.perf{i}..."}
-                    },
-                    status=200
-                )
-            
-            # Test concurrent execution
-            start_time = time.time()
-            concurrent_tasks = [
-                client.solve_turnstile_async(url, auto_detect=True) 
-                for url in urls
-            ]
-            concurrent_results = await asyncio.gather(*concurrent_tasks)
-            concurrent_time = time.time() - start_time
-            
-            # All should succeed
-            assert all(r.is_success for r in concurrent_results)
+class TestAsyncSession:
+    """Test reuse of the shared aiohttp session"""
+    
+    async def test_session_reused_across_calls(self, client):
+        """Test that consecutive async calls share one session"""
+        await client.health_check_async()
+        session = client._sessions[asyncio.get_running_loop()]
+        await client.health_check_async()
+        
+        assert client._sessions[asyncio.get_running_loop()] is session
+    
+    async def test_session_recreated_after_close(self):
+        """Test that a closed client opens a new session on next use"""
+        client = RapidCaptchaClient(API_KEY)
+        
+        await client.health_check_async()
+        first_session = client._sessions[asyncio.get_running_loop()]
+        await client.close()
+        await client.health_check_async()
+        session = client._sessions[asyncio.get_running_loop()]
+        
+        assert first_session.closed
+        assert session is not first_session
+        assert not session.closed
+        
+        await client.close()
+    
+    async def test_session_per_event_loop(self):
+        """Test that a loop that stops running keeps its session until it is closed"""
+        client = RapidCaptchaClient(API_KEY)
+        old_loop = asyncio.new_event_loop()
+        
+        # Use the client on a loop in another thread, which then never runs again
+        await asyncio.get_running_loop().run_in_executor(
+            None, old_loop.run_until_complete, client.health_check_async()
+        )
+        old_session = client._sessions[old_loop]
+        await client.health_check_async()
+        session = client._sessions[asyncio.get_running_loop()]
+        
+        # The old loop's session is neither reused nor closed out from under it
+        assert session is not old_session
+        assert not old_session.closed
+        assert not asyncio.all_tasks(old_loop)
+        
+        # Once its loop is closed the session can only be detached
+        old_loop.close()
+        await client.close()
+        
+        assert old_session.closed
+        assert session.closed
+        assert not client._sessions
+
+
+class TestAsyncHttpxTransport:
+    """Test async operations over the httpx HTTP/2 transport"""
+    
+    async def test_solve_turnstile_async_httpx(self, httpx_clients):
+        """Test that the httpx transport submits and polls over one HTTP/2 client"""
+        created_before = len(httpx_clients)
+        
+        async with RapidCaptchaClient(API_KEY, max_concurrent=4, transport="httpx") as client:
+            result = await client.solve_turnstile_async("https://example.com/context")
+            await client.health_check_async()
             
-            # Should be very fast due to mocking
-            assert concurrent_time < 1.0
+            assert not client._sessions
+            httpx_client = client._httpx_clients[asyncio.get_running_loop()]
+        
+        assert result.is_success
+        assert result.turnstile_value == "0.context..."
+        assert httpx_client.is_closed
+        
+        assert len(httpx_clients) == created_before + 1
+        assert httpx_clients[-1]["http2"] is True
+        assert httpx_clients[-1]["limits"].max_connections == 4
+    
+    async def test_solve_turnstile_async_httpx_server_wait(self, httpx_clients):
+        """Test long-polling submits over the httpx transport"""
+        async with RapidCaptchaClient(API_KEY, transport="httpx") as client:
+            result = await client.solve_turnstile_async(
+                "https://example.com/server-wait", server_wait=True
+            )
+        
+        assert result.is_success
+        assert result.task_id == "server-wait-task"
+    
+    async def test_httpx_error_responses(self, httpx_clients):
+        """Test that httpx responses map to the client exceptions"""
+        async with RapidCaptchaClient("Rapidcaptcha-invalid-key", transport="httpx") as client:
+            with pytest.raises(APIKeyError, match="Invalid API key"):
+                await client.health_check_async()
+        
+        async with RapidCaptchaClient(API_KEY, transport="httpx") as client:
+            with pytest.raises(RateLimitError):
+                await client.submit_turnstile_async("https://example2.com")
+            with pytest.raises(RapidCaptchaError, match="Invalid JSON response from API"):
+                await client.get_result_async("invalid-json-task")
+    
+    async def test_async_method_no_httpx(self, monkeypatch):
+        """Test the httpx transport without the httpx library"""
+        monkeypatch.setattr("rapidcaptcha.client.HAS_HTTPX", False)
+        client = RapidCaptchaClient(API_KEY, transport="httpx")
+        
+        with pytest.raises(ImportError, match="httpx library is required"):
+            await client.health_check_async()
+    
+    async def test_async_method_no_h2(self, monkeypatch):
+        """Test the httpx transport without httpx's HTTP/2 dependency"""
+        monkeypatch.setattr("rapidcaptcha.client.HAS_HTTPX", True)
+        monkeypatch.setattr("rapidcaptcha.client.HAS_H2", False)
+        client = RapidCaptchaClient(API_KEY, transport="httpx")
+        
+        with pytest.raises(ImportError, match="h2 library is required"):
+            await client.health_check_async()
 
 
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])
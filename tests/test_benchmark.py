@@ -0,0 +1,58 @@
+"""
+Benchmarks for RapidCaptcha client asynchronous operations
+
+Kept apart from test_async.py, whose tests all run under the asyncio mark;
+benchmarks are sync tests that drive their own event loop.
+"""
+
+import pytest
+import asyncio
+
+from rapidcaptcha import RapidCaptchaClient
+
+from . import mock_api
+from .mock_api import API_KEY, local_server
+
+
+class TestAsyncPerformance:
+    """Test async performance characteristics"""
+    
+    @pytest.mark.benchmark(group="async-solve")
+    def test_concurrent_solve_benchmark(self, benchmark):
+        """Benchmark a concurrent batch of solves against a local API server"""
+        urls = ["https://example.com/perf"] * 3
+        
+        # Reuse one loop, server and client so only the solves themselves are
+        # measured; requests make real round-trips to the local server
+        loop = asyncio.new_event_loop()
+        server = local_server()
+        loop.run_until_complete(server.start_server())
+        client = RapidCaptchaClient(API_KEY, base_url=str(server.make_url("")))
+        
+        async def _run_batch():
+            # Order doesn't matter here, so collect solves as they complete
+            results = {}
+            for solve in asyncio.as_completed([
+                client.solve_turnstile_async(url, auto_detect=True)
+                for url in urls
+            ]):
+                result = await solve
+                results[result.task_id] = result
+            return results
+        
+        try:
+            results = benchmark(lambda: loop.run_until_complete(_run_batch()))
+        finally:
+            loop.run_until_complete(client.close())
+            loop.run_until_complete(server.close())
+            loop.close()
+            # Each round registered its own perf-task results
+            mock_api.reset()
+        
+        # All should succeed, each with its own task
+        assert len(results) == 3
+        assert all(r.is_success for r in results.values())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -4,7 +4,9 @@ Test cases for RapidCaptcha client synchronous operations
 
 import pytest
 import json
+import sys
 import time
+from dataclasses import asdict
 from unittest.mock import Mock, patch
 import responses
 
@@ -26,6 +28,8 @@ class TestRapidCaptchaClient:
         assert client.timeout == 300
         assert client.max_retries == 3
         assert client.retry_delay == 2.0
+        assert client.max_concurrent == 10
+        assert client.transport == "aiohttp"
     
     def test_init_invalid_api_key(self):
         """Test client initialization with invalid API key"""
@@ -45,12 +49,66 @@ class TestRapidCaptchaClient:
             base_url="https://custom.api.com",
             timeout=120,
             max_retries=5,
-            retry_delay=1.5
+            retry_delay=1.5,
+            max_concurrent=4,
+            transport="httpx"
         )
         assert client.base_url == "https://custom.api.com"
         assert client.timeout == 120
         assert client.max_retries == 5
         assert client.retry_delay == 1.5
+        assert client.max_concurrent == 4
+        assert client.transport == "httpx"
+    
+    def test_init_invalid_max_concurrent(self):
+        """Test client initialization with an invalid connection limit"""
+        with pytest.raises(ValidationError, match="max_concurrent must be at least 1"):
+            RapidCaptchaClient("Rapidcaptcha-test-key", max_concurrent=0)
+    
+    def test_init_invalid_transport(self):
+        """Test client initialization with an unknown async transport"""
+        with pytest.raises(ValidationError, match="Unsupported transport: urllib3"):
+            RapidCaptchaClient("Rapidcaptcha-test-key", transport="urllib3")
+    
+    @responses.activate
+    def test_custom_base_url_endpoints(self):
+        """Test that requests are sent to the configured base URL"""
+        responses.add(
+            responses.POST,
+            "https://custom.api.com/api/solve/turnstile",
+            json={"task_id": "custom-task"},
+            status=202
+        )
+        responses.add(
+            responses.GET,
+            "https://custom.api.com/api/result/custom-task",
+            json={"task_id": "custom-task", "status": "pending"},
+            status=200
+        )
+        
+        client = RapidCaptchaClient("Rapidcaptcha-test-key", base_url="https://custom.api.com/")
+        task_id = client.submit_turnstile("https://example.com", auto_detect=True)
+        result = client.get_result(task_id)
+        
+        assert task_id == "custom-task"
+        assert result.is_pending
+    
+    @responses.activate
+    def test_base_url_changed_after_init(self):
+        """Test that endpoints follow a base URL assigned after construction"""
+        responses.add(
+            responses.GET,
+            "https://other.api.com/{v1}/api/result/moved-task",
+            json={"task_id": "moved-task", "status": "pending"},
+            status=200
+        )
+        
+        client = RapidCaptchaClient("Rapidcaptcha-test-key")
+        client.base_url = "https://other.api.com/{v1}/"
+        result = client.get_result("moved-task")
+        
+        assert client.base_url == "https://other.api.com/{v1}"
+        assert result.is_pending
     
     def test_validate_url(self):
         """Test URL validation"""
@@ -376,9 +434,9 @@ class TestWaitForResult:
         
         client = RapidCaptchaClient("Rapidcaptcha-test-key")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = client.wait_for_result("test-task-123", poll_interval=0.1)
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         
         assert result.is_success
         assert result.turnstile_value == "0.abc123def456..."
@@ -590,6 +648,22 @@ class TestCaptchaResult:
         assert not result.is_error
         assert "PENDING" in str(result)
         assert "test-789" in str(result)
+    
+    def test_captcha_result_status_flags_follow_status(self):
+        """Test that status flags track status and aren't dataclass fields"""
+        result = CaptchaResult(task_id="test-1", status=TaskStatus.PENDING)
+        result.status = TaskStatus.SUCCESS
+        
+        assert result.is_success
+        assert not result.is_pending
+        assert "is_success" not in asdict(result)
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+")
+    def test_captcha_result_uses_slots(self):
+        """Test that CaptchaResult instances have no per-instance __dict__"""
+        result = CaptchaResult(task_id="test-1", status=TaskStatus.SUCCESS)
+        
+        assert not hasattr(result, "__dict__")
 
 
 class TestErrorHandling:
@@ -416,11 +416,9 @@ class TestLibraryImportErrors:
             with pytest.raises(ImportError, match="requests library is required"):
                 client.get_result("test-task")
     
-    @pytest.mark.asyncio
-    async def test_async_operations_without_aiohttp(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_async_operations_without_aiohttp(self, client):
         """Test async operations when aiohttp library is not available"""
-        client = RapidCaptchaClient("Rapidcaptcha-test-key")
-        
         with patch('rapidcaptcha.client.HAS_AIOHTTP', False):
             # Test various async methods
             with pytest.raises(ImportError, match="aiohttp library is required"):